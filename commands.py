@@ -68,6 +68,8 @@ class DocblockrPythonCommand(sublime_plugin.TextCommand):
         parser          {Object}
         line            {String}
         contents        {String}
+        text            {String}
+        tab_size        {Integer}
     """
 
     position = 0
@@ -78,6 +80,8 @@ class DocblockrPythonCommand(sublime_plugin.TextCommand):
     parser: Optional[PythonParser] = None
     line = ""
     contents = ""
+    text = ""
+    tab_size = 4
     view_settings = None
     project_settings = None
 
@@ -95,7 +99,9 @@ class DocblockrPythonCommand(sublime_plugin.TextCommand):
         self.initialize(self.view)
 
         # If this docstring is already closed, then generate a new line
-        if self.parser.is_docstring_closed(self.view, self.view.sel()[0].end()) is True:
+        if self.parser.is_docstring_closed(
+            self.view, self.position, self.text, self.tab_size
+        ) is True:
             write(self.view, "\n")
             return
 
@@ -122,11 +128,12 @@ class DocblockrPythonCommand(sublime_plugin.TextCommand):
             view {sublime.View} -- The view to be edited
         """
         self.view_settings = view.settings()
+        self.tab_size = self.view_settings.get("tab_size", 4)
 
         project_settings = (view.window().project_data() or {}).get("settings", {})
         self.project_settings = project_settings.get(PACKAGE_NAME, {})
 
-        position = view.sel()[0].end()
+        self.position = position = view.sel()[0].end()
 
         # trailing characters are put inside the body of the comment
         self.trailing_rgn = sublime.Region(position, view.line(position).end())
@@ -136,6 +143,9 @@ class DocblockrPythonCommand(sublime_plugin.TextCommand):
             re.sub(r'\s*("""|\'\'\')\s*$', "", self.trailing_string)
         )
 
+        # read the view once, the parser walks its lines from this copy
+        self.text = view.substr(sublime.Region(0, view.size()))
+
         self.parser = get_parser(view)
 
         log.debug("get the parser -> %s", self.parser)
@@ -144,9 +154,9 @@ class DocblockrPythonCommand(sublime_plugin.TextCommand):
             return
 
         # read the previous line
-        self.line, multiline = self.parser.get_definition(view, position)
+        self.line, multiline = self.parser.get_definition(view, position, self.text)
         self.contents = self.parser.get_definition_contents(
-            view, view.line(position).end(), multiline
+            view, view.line(position).end(), multiline, self.text, self.tab_size
         )
 
         if self.line and re.match(r"^\s*async\s+def", self.line):
@@ -1,11 +1,78 @@
 """Parsing Class for python files."""
 import re
 import sublime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from ..utils.log import child_logger
 
 log = child_logger(__name__)
 
+_COMMENT_RE = re.compile(r"^\s*(\#)")
+_DECORATOR_LINE_RE = re.compile(r"^\s*(\@)")
+_CLASS_RE = re.compile(r"^\s*(class )")
+_DISPATCH_RE = re.compile(r"^\s*(?:(?P<cls>class )|(?P<fn>def ))")
+_ASYNC_DEF_RE = re.compile(r"^\s*(async\s+)?(def )")
+_BOOL_NAME_RE = re.compile("(?:is|has)[A-Z_]")
+_FUNCTION_NAME_RE = re.compile("^(?:cb|callback|done|next|fn)$")
+_OPTIONAL_RE = re.compile(r"^Optional\[(.+?)\]$")
+_VARIABLE_RE = re.compile(
+    r"^\s*((?:(?!from |import |async |def |class |@).)+$)", re.MULTILINE
+)
+_EXTENDS_RE = re.compile(r"^\s*class \w*\((.*)\):\s*$")
+_ARGUMENTS_RE = re.compile(r"^\s*def\s+\w+\((.*)\)")
+_TYPEHINT_RE = re.compile(r"(\w+)\s*:\s*([\w\.]+\[[^:]*\]|[\w\.]+)\s*")
+_RETURN_HINT_RE = re.compile(
+    r"^\s*def\s+\w+\(.*\)\s*->\s*([\w\.]+\[[^:]*\]|[\w\.]+)\s*:",
+    re.DOTALL | re.MULTILINE,
+)
+# Lines of a function relevant to its docstring: decorators, definitions, the
+# first word returned or yielded, and raised exceptions
+_FUNCTION_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"@(?P<decorator>[a-zA-Z0-9_\.]*)(?:\(.*\)|$)"
+    r"|(?P<definition>(?:async\s+)?def\s)"
+    r"|(?P<returns>return|yield) (?P<value>\S+)"
+    r"|raise (?P<exception>\w+)"
+    r")",
+    re.MULTILINE,
+)
+_INLINE_DOCSTRING_RE = re.compile(r'^\s*(""".*"""|\'\'\'.*\'\'\')\s*$')
+_DOCSTRING_OPEN_RE = re.compile(r'^\s*("""|\'\'\')')
+_SOURCE_LANG_RE = re.compile(r"\bsource\.([a-z+\-]+)")
+
+_EXCLUDED_DECORATORS = frozenset({"classmethod", "staticmethod", "property"})
+_EXCLUDED_PARAMETERS = frozenset({"self", "cls"})
+
+
+# Characters which open a section inside which commas are not separators between
+# different arguments
+_OPENING_RE = re.compile(r"""["'<({\[]""")
+
+# A section opened by one of `"'<({[` and closed by the matching `"'>)}]`.
+# Sections run to their closing character (or the end of the string) and are
+# not nested; a backslash inside of them escapes the next character.
+_SECTION_PATTERN = (
+    r""""[^"\\]*(?:\\.?[^"\\]*)*"?"""
+    r"""|'[^'\\]*(?:\\.?[^'\\]*)*'?"""
+    r"""|<[^>\\]*(?:\\.?[^>\\]*)*>?"""
+    r"""|\([^)\\]*(?:\\.?[^)\\]*)*\)?"""
+    r"""|\{[^}\\]*(?:\\.?[^}\\]*)*\}?"""
+    r"""|\[[^\]\\]*(?:\\.?[^\]\\]*)*\]?"""
+)
+_SECTION_RE = re.compile(_SECTION_PATTERN, re.DOTALL)
+# One element of a comma separated string: plain characters and whole sections
+_ELEMENT_RE = re.compile(
+    r"""(?:[^,"'<({\[]+|""" + _SECTION_PATTERN + r""")+""", re.DOTALL
+)
+_ESCAPED_CHAR_RE = re.compile(r"\\(.?)", re.DOTALL)
+
+
+def _unescape_section(match):
+    section = match.group()
+    # without escaped backslashes every backslash escapes the next character
+    if "\\\\" not in section:
+        return section.replace("\\", "")
+    return _ESCAPED_CHAR_RE.sub(r"\1", section)
+
 
 def split_by_commas(string):
     """Split a string by unenclosed commas.
@@ -29,110 +96,163 @@ def split_by_commas(string):
     if not string:
         return out
 
-    # the current token
-    current = ""
+    # Without any enclosed sections every comma is a separator, leave the whole
+    # scan to `str.split`
+    if _OPENING_RE.search(string) is None:
+        for element in string.split(","):
+            element = element.strip()
+            if element:
+                out.append(element)
+        return out
 
-    # characters which open a section inside which commas are not separators between different
-    # arguments
-    open_quotes = "\"'<({["
-    # characters which close the section. The position of the character here should match the
-    # opening indicator in `open_quotes`
-    close_quotes = "\"'>)}]"
-
-    matching_quote = ""
-    inside_quotes = False
-    is_next_literal = False
-
-    for char in string:
-        if is_next_literal:  # previous char was a \
-            current += char
-            is_next_literal = False
-        elif inside_quotes:
-            if char == "\\":
-                is_next_literal = True
-            else:
-                current += char
-                if char == matching_quote:
-                    inside_quotes = False
-        else:
-            if char == ",":
-                if len(current.strip()):
-                    out.append(current.strip())
-                current = ""
-            else:
-                current += char
-                quote_index = open_quotes.find(char)
-                if quote_index > -1:
-                    matching_quote = close_quotes[quote_index]
-                    inside_quotes = True
-
-    if len(current.strip()):
-        out.append(current.strip())
+    if "\\" not in string:
+        for element in _ELEMENT_RE.findall(string):
+            element = element.strip()
+            if element:
+                out.append(element)
+        return out
+
+    # Backslashes only escape inside of sections, walk the sections one by one
+    # and split the plain runs between them with `str.split`
+    current = ""
+    position = 0
+
+    for match in _SECTION_RE.finditer(string):
+        pieces = string[position:match.start()].split(",")
+        current += pieces[0]
+        for piece in pieces[1:]:
+            current = current.strip()
+            if current:
+                out.append(current)
+            current = piece
+        current += _unescape_section(match)
+        position = match.end()
+
+    pieces = string[position:].split(",")
+    current += pieces[0]
+    for piece in pieces[1:]:
+        current = current.strip()
+        if current:
+            out.append(current)
+        current = piece
+
+    current = current.strip()
+    if current:
+        out.append(current)
     return out
 
 
-START_KEYWORD_RULES = (
-    re.compile(r"^def\s+"),
-    re.compile(r"^class\s+"),
-    re.compile(r"^async\s+def\s+"),
-)
+_START_KW_RE = re.compile(r"^(?:async\s+def|def|class)\s+")
 
 
 def is_start_keyword(line: str) -> bool:
-    for rule in START_KEYWORD_RULES:
-        if rule.match(line):
-            log.debug("the line contains a keyword: %s", rule)
-            return True
+    return _START_KW_RE.match(line) is not None
+
+
+def line_bounds(text: str, position: int):
+    """Get the bounds of the line containing a position in a text.
+
+    Equivalent of `sublime.View.line` for an already read buffer.
+
+    Arguments:
+        text     {str}     -- Contents of the view
+        position {Integer} -- Position in the text
+
+    Returns:
+        {tuple} Beginning and end of the line, excluding the line break
+    """
+    begin = text.rfind("\n", 0, position) + 1
+    end = text.find("\n", position)
+    if end == -1:
+        end = len(text)
 
-    return False
+    return begin, end
 
 
-def read_next_line(view: sublime.View, position: int, reverse=False):
+def get_indentation_level(line: str, tab_size: int) -> int:
+    """Get the indentation level of a line.
+
+    Equivalent of `sublime.View.indentation_level` for an already read line, a tab
+    advances to the next tab stop.
+
+    Arguments:
+        line     {str}     -- Line to be measured
+        tab_size {Integer} -- Width of one indentation level
+
+    Returns:
+        {Integer} Number of whole indentation levels
+    """
+    indentation = line[: len(line) - len(line.lstrip(" \t"))]
+    if "\t" not in indentation:
+        return len(indentation) // tab_size
+
+    column = 0
+    for char in indentation:
+        column += tab_size - column % tab_size if char == "\t" else 1
+
+    return column // tab_size
+
+
+def read_next_line(text: str, position: int, reverse=False, decorators=False):
     """Get the next line of the view.
 
     From the given position, will expand the region to the current line in the file,
     grab the ending (beginning if reverse) position, and add (subtract if reverse) 1
     to get the next line in the file. Will return False if the next line is either the
     beginning or the end of the file. This function is iteratable to continuously
-    provide file lines
+    provide file lines.
+    The lines are sliced from the contents of the view, which the caller reads once,
+    instead of querying the view for every line.
     Arguments:
-        view     {sublime.View} -- View to be read
-        position {Integer}      -- Position in the view
+        text     {str}     -- Contents of the view to be read
+        position {Integer} -- Position in the view
 
     Keyword Arguments:
         reverse {Bool} -- If false, will read to the end of the file (default False)
+        decorators {Bool} -- If reverse, keep reading the decorator lines above the
+            definition line (default False)
 
     Yields:
-        {sublime.Region} Region of the next line.
+        {str} The next line.
 
     Returns:
         {Bool} False when at the beginning or end of the file
     """
-    current_line = view.line(position)
-    modifier = 1
-    if reverse:
-        modifier = -1
+    size = len(text)
+    defined = False
 
-    go_on = True
-    while go_on:
-        next_line = current_line.begin() if reverse else current_line.end()
-        next_line += modifier
+    begin, end = line_bounds(text, position)
+    while True:
+        next_line = begin - 1 if reverse else end + 1
 
         log.debug("next line -> %s", next_line)
 
-        if reverse:
-            line = view.line(next_line)
-            line_str = view.substr(line).strip()
-            if is_start_keyword(line_str):
-                go_on = False
-
         # Ensure within bounds of the view
-        if not (next_line < view.size() and next_line > 0):
+        if not (next_line < size and next_line > 0):
+            break
+
+        begin, end = line_bounds(text, next_line)
+        line = text[begin:end]
+
+        # Above the definition line, only decorators are read
+        if defined and not _DECORATOR_LINE_RE.match(line):
             break
 
-        current_line = view.line(next_line)
+        yield line
+
+        if reverse and not defined and is_start_keyword(line.strip()):
+            if not decorators:
+                break
+            defined = True
+
 
-        yield current_line
+# A decimal number literal: optional sign, digits (optionally separated by
+# underscores) with an optional fraction, and an optional exponent
+_NUMBER_RE = re.compile(
+    r"[+-]?"
+    r"(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)"
+    r"(?:[eE][+-]?\d(?:_?\d)*)?"
+)
 
 
 def is_numeric(val):
@@ -144,11 +264,11 @@ def is_numeric(val):
     Returns:
         bool -- if the passed value is numeric
     """
-    try:
-        float(val)
+    # plain integers are the most common numeric values
+    if val.isdecimal():
         return True
-    except ValueError:
-        return False
+
+    return _NUMBER_RE.fullmatch(val) is not None
 
 
 def guess_type_from_name(name):
@@ -160,15 +280,32 @@ def guess_type_from_name(name):
     Returns:
         {str} -- string of the builtin type or None if one cannot be found
     """
-    if re.match("(?:is|has)[A-Z_]", name):
+    if _BOOL_NAME_RE.match(name):
         return "bool"
 
-    if re.match("^(?:cb|callback|done|next|fn)$", name):
+    if _FUNCTION_NAME_RE.match(name):
         return "function"
 
     return None
 
 
+# characters a value has to start with to possibly be a number
+_NUM_FIRSTCHARS = frozenset("0123456789.-+")
+
+_FIRST_CHAR_TYPES = {'"': "str", "'": "str", "[": "list", "{": "dict", "(": "tuple"}
+
+_STRING_PREFIX_TYPES = {
+    "r'": "regexp",
+    'r"': "regexp",
+    "R'": "regexp",
+    'R"': "regexp",
+    "u'": "unicode",
+    'u"': "unicode",
+    "U'": "unicode",
+    'U"': "unicode",
+}
+
+
 def guess_type_from_value(value: Optional[str]) -> Optional[str]:
     """Make educated assertion about the type of the value.
 
@@ -178,41 +315,41 @@ def guess_type_from_value(value: Optional[str]) -> Optional[str]:
     Returns:
         {str} -- string of the builtin type or None if one cannot be found
     """
-    if value is None or not isinstance(value, str):
+    if not value or not isinstance(value, str):
         return None
 
-    first_char = value[0:1]
+    first_char = value[0]
 
-    if is_numeric(value):
+    if first_char in _NUM_FIRSTCHARS and is_numeric(value):
         return "number"
 
-    char_map = {'"': "str", "'": "str", "[": "list", "{": "dict", "(": "tuple"}
+    value_type = _FIRST_CHAR_TYPES.get(first_char)
+    if value_type is not None:
+        return value_type
 
-    if char_map.get(first_char) is not None:
-        return char_map.get(first_char)
-
-    if value in ["True", "False"]:
+    if value == "True" or value == "False":
         return "bool"
 
-    if value[:2] in ["r'", 'r"', "R'", 'R"']:
-        return "regexp"
-
-    if value[:2] in ["u'", 'u"', "U'", 'U"']:
-        return "unicode"
+    value_type = _STRING_PREFIX_TYPES.get(value[:2])
+    if value_type is not None:
+        return value_type
 
-    if value[:7] == "lambda ":
+    if value.startswith("lambda "):
         return "function"
 
     return None
 
 
-MULTILINE_PATTERNS = (
+# Every multi-line declaration ends with an opening parenthesis
+_MULTILINE_RE = re.compile(
+    r"^(?:"
     # A function defined on multiple lines
-    re.compile(r"^\s*(async\s+)?def\s+\w+\($"),
+    r"(?:async\s+)?def\s+\w+"
     # An import statement takes up multiple lines
-    re.compile(r"^from\s+\w+(\.\w+)*\s+import\s+\($"),
+    r"|from\s+\w+(?:\.\w+)*\s+import\s+"
     # A variable defined on multiple lines
-    re.compile(r"^\w+\s+=\s+\w+\($"),
+    r"|\w+\s+=\s+\w+"
+    r")\($"
 )
 
 
@@ -227,11 +364,10 @@ def use_multiple_lines(line: str) -> bool:
     """
     line = line.strip()
 
-    for ptn in MULTILINE_PATTERNS:
-        if ptn.match(line):
-            return True
+    if not line.endswith("("):
+        return False
 
-    return False
+    return _MULTILINE_RE.match(line) is not None
 
 
 class PythonParser:
@@ -247,7 +383,7 @@ class PythonParser:
         self.closing_string = '"""'
 
     @classmethod
-    def get_definition(cls, view: sublime.View, position: int):
+    def get_definition(cls, view: sublime.View, position: int, text: str):
         """Get the definition line.
 
         String representation fo the line above the docstring
@@ -255,6 +391,7 @@ class PythonParser:
         Arguments:
             view {sublime.View} -- The sublime view in which this is executing
             position {Integer} -- Position of the docstring
+            text {String} -- Contents of the view
 
         Decorators:
             classmethod
@@ -263,7 +400,7 @@ class PythonParser:
             {String} Representation of the definition line
         """
         # reset the position to the beginning of the line
-        position = view.line(position).begin()
+        position, _ = line_bounds(text, position)
 
         log.debug("current position -> %s", position)
 
@@ -272,13 +409,16 @@ class PythonParser:
             return None, None
 
         # indentation_level = view.indentation_level(position)
-        line: str = ""
+        lines: List[str] = []
 
-        multiline = 0
-        for current_line in read_next_line(view, position, True):
-            current_line_string = view.substr(current_line).strip()
-            line = current_line_string + " " + line
-            multiline += 1
+        for current_line_string in read_next_line(text, position, True):
+            lines.append(current_line_string.strip())
+
+        multiline = len(lines)
+        # the lines were read bottom up
+        line = "".join(
+            current_line_string + " " for current_line_string in reversed(lines)
+        )
 
         log.debug("number of lines defined -> %s", multiline)
         log.debug("definition -- {}".format(line))
@@ -287,53 +427,64 @@ class PythonParser:
 
     @classmethod
     def read_above(
-        cls, view: sublime.View, position: int, multiline: Optional[int] = None
+        cls,
+        text: str,
+        position: int,
+        indentation_level: int,
+        tab_size: int,
+        multiline: Optional[int] = None,
     ):
         """Read the contents above the current definition line.
         Gathers additional context about the lines above a definition line,
         e.g. Decorators.
         Arguments:
-            view {sublime.View} -- The sublime view in which this is executing
+            text {String} -- Contents of the view
             position {Integer} -- Position of the docstring
+            indentation_level {Integer} -- Indentation level of the docstring
+            tab_size {Integer} -- Width of one indentation level
         Returns:
             string, string -- type of definition, stringified definition contents
         """
-        indentation_level = view.indentation_level(position)
         docstring_type = None
-        definition = ""
+        lines: List[str] = []
 
-        for current_line in read_next_line(view, position, True):
+        for current_line in read_next_line(text, position, True, decorators=True):
             # Not an empty line
-            current_line_string = view.substr(current_line).strip()
+            current_line_string = current_line.strip()
             if len(current_line_string) == 0:
                 continue
 
             # Ignore comments
-            if re.match(r"^\s*(\#)", current_line_string):
+            if _COMMENT_RE.match(current_line_string):
                 continue
 
             if multiline and multiline == 1:
                 # When we move up in scope, stop reading
-                current_indentation = view.indentation_level(current_line.end())
+                current_indentation = get_indentation_level(current_line, tab_size)
                 if not current_indentation == indentation_level - 1:
                     break
 
                 # Keeping it simple, will not parse multiline decorators
-                if docstring_type is not None and not re.match(
-                    r"^\s*(\@)", current_line_string
+                if docstring_type is not None and not _DECORATOR_LINE_RE.match(
+                    current_line_string
                 ):
                     break
 
             # Set to module, class, or function
             if docstring_type is None:
-                if re.match(r"^\s*(class )", current_line_string):
+                if _CLASS_RE.match(current_line_string):
                     docstring_type = "class"
-                elif re.match(r"^\s*(async\s+)?(def )", current_line_string):
+                elif _ASYNC_DEF_RE.match(current_line_string):
                     docstring_type = "function"
                 else:
                     docstring_type = "module"
 
-            definition = current_line_string + "\n" + definition
+            lines.append(current_line_string)
+
+        # the lines were read bottom up
+        definition = "".join(
+            current_line_string + "\n" for current_line_string in reversed(lines)
+        )
 
         log.debug(
             "result of `read_above` -> type: '%s', definition: '%s'",
@@ -345,7 +496,12 @@ class PythonParser:
 
     @classmethod
     def get_definition_contents(
-        cls, view: sublime.View, position: int, multiline: Optional[int]
+        cls,
+        view: sublime.View,
+        position: int,
+        multiline: Optional[int],
+        text: str,
+        tab_size: int,
     ):
         """Get the relevant contents of the module/class/function.
 
@@ -358,6 +514,8 @@ class PythonParser:
         Arguments:
             view {sublime.View} -- The sublime view in which this is executing
             position {Integer} -- Position the docstring was created on
+            text {String} -- Contents of the view
+            tab_size {Integer} -- Width of one indentation level
 
         Decorators:
             classmethod
@@ -365,24 +523,27 @@ class PythonParser:
         Returns:
             {String} Contents that matter
         """
-        indentation_level = view.indentation_level(position)
+        begin, end = line_bounds(text, position)
+        indentation_level = get_indentation_level(text[begin:end], tab_size)
         definition: str = ""
 
-        docstring_type, definition = cls.read_above(view, position, multiline)
+        docstring_type, definition = cls.read_above(
+            text, position, indentation_level, tab_size, multiline
+        )
         # Read above the docstring for function/class definition and decorators
 
         # Read the class/function contents
-        for current_line in read_next_line(view, position):
+        for current_line_string in read_next_line(text, position):
             # Not an empty line
-            current_line_string = view.substr(current_line).rstrip()
+            current_line_string = current_line_string.rstrip()
             if len(current_line_string) == 0:
                 continue
 
             # Remove comments
-            if re.match(r"^\s*(\#)", current_line_string):
+            if _COMMENT_RE.match(current_line_string):
                 continue
 
-            current_indentation = view.indentation_level(current_line.end())
+            current_indentation = get_indentation_level(current_line_string, tab_size)
 
             # Exit if this has de-indented below the current level
             if current_indentation < indentation_level:
@@ -424,19 +585,18 @@ class PythonParser:
         log.debug("line -> %s, contents: %s", line, contents)
 
         # At beginning of the module
-        output = self.process_module(line, contents)
-        if output is not None:
-            return output
+        if line is None:
+            return self.process_module(line, contents)
 
-        output = self.process_class(line, contents)
-        if output is not None:
-            return output
+        match = _DISPATCH_RE.match(line)
+        if match is None:
+            log.debug("neither class nor function type")
+            return {}
 
-        output = self.process_function(line, contents)
-        if output is not None:
-            return output
+        if match.lastgroup == "cls":
+            return self.process_class(line, contents)
 
-        return {}
+        return self.process_function(line, contents)
 
     def process_variable(self, variable: str, hints: Optional[Dict[str, str]] = None):
         """Process an individual variable.
@@ -470,8 +630,9 @@ class PythonParser:
             hints[variable] = pieces[1].strip()
 
         if params.get("default") and hints.get(variable):
-            if re.match(r"^Optional\[.+?\]$", hints[variable]):
-                hints[variable] = re.sub(r"^Optional\[(.+?)\]$", r"\1", hints[variable])
+            optional = _OPTIONAL_RE.match(hints[variable])
+            if optional:
+                hints[variable] = optional.group(1)
 
         params["name"] = variable
         params["type"] = (
@@ -491,22 +652,14 @@ class PythonParser:
         Returns:
             {Dictionary} -- Dictionary of attributes to create snippets from
         """
-        variables = []
-        regex = re.compile(
-            r"^\s*((?:(?!from |import |async |def |class |@).)+$)", re.MULTILINE
-        )
-        matches = re.findall(regex, contents)
-
-        if len(matches) == 0:
-            return None
+        variables = [
+            self.process_variable(match.group(1))
+            for match in _VARIABLE_RE.finditer(contents)
+        ]
 
-        log.debug("class variables: %s", matches)
+        log.debug("class variables: %s", variables)
 
-        for match in matches:
-            variable = self.process_variable(match)
-            variables.append(variable)
-
-        return variables
+        return variables or None
 
     def process_module(self, line: str, contents: str):
         """Parse the whole module file to find module level variables.
@@ -521,9 +674,6 @@ class PythonParser:
         Returns:
             {Dictionary} Dictionary of attributes to create snippets from
         """
-        if line is not None:
-            return None
-
         parsed_module = []
         variables = self.parse_variables(contents)
 
@@ -543,7 +693,7 @@ class PythonParser:
         Returns:
             {Dictionary} -- Dictionary of attributes to create snippets from
         """
-        extends = re.search(r"^\s*class \w*\((.*)\):\s*$", line)
+        extends = _EXTENDS_RE.search(line)
 
         if not extends:
             return None
@@ -572,9 +722,6 @@ class PythonParser:
         Returns:
             {Dictionary} Dictionary of attributes to create snippets from
         """
-        if not re.match(r"^\s*(class )", line):
-            return None
-
         parsed_class = []
 
         extends = self.parse_extends(line)
@@ -589,39 +736,54 @@ class PythonParser:
 
         return parsed_class
 
-    def parse_decorators(self, definition, content):
-        """Parse the lines above the definition for decorators.
-
-        Finds and returns all the decorators over a function that aren't
-        in the excluded list.
+    def scan_function(self, contents: str):
+        """Collect the decorators, returns and raises of a function in one pass.
 
         Arguments:
-            definition {str} -- definition line.
-            content {str} -- Content definition
+            contents {str} -- contents of the definition
 
         Returns:
-            {list} -- list of decorators
+            {tuple} -- decorator names, (keyword, value) pairs of the returns and
+                       yields, and the raised exception types
         """
-        lines = content.split("\n")
-        excluded_decorators = ["classmethod", "staticmethod", "property"]
-        decorators = []
+        decorators: List[str] = []
+        returns: List[Tuple[str, str]] = []
+        raises: List[str] = []
+
+        # Only the lines above the first definition line are its decorators, the
+        # ones further down belong to nested functions
+        defined = False
+
+        for match in _FUNCTION_LINE_RE.finditer(contents):
+            if match.group("decorator") is not None:
+                if not defined:
+                    decorators.append(match.group("decorator"))
+            elif match.group("definition") is not None:
+                defined = True
+            elif match.group("returns") is not None:
+                returns.append((match.group("returns"), match.group("value")))
+            else:
+                raises.append(match.group("exception"))
 
-        for line in lines:
-            if line == definition:
-                break
+        return decorators, returns, raises
 
-            match = re.findall(r"^\s*@([a-zA-Z0-9_\.]*)(\(.*\)|$)", line)
+    def parse_decorators(self, decorators: List[str]):
+        """Filter the decorators found above the definition.
 
-            if len(match) == 0:
-                continue
-
-            decorator = match[0][0]
-            if decorator in excluded_decorators:
-                continue
+        Returns all the decorators over a function that aren't
+        in the excluded list.
 
-            decorators.append(decorator)
+        Arguments:
+            decorators {list} -- decorator names found by `scan_function`
 
-        return decorators
+        Returns:
+            {list} -- list of decorators
+        """
+        return [
+            decorator
+            for decorator in decorators
+            if decorator not in _EXCLUDED_DECORATORS
+        ]
 
     def parse_arguments(self, line: str):
         """Find and parses each argument and keyword argument.
@@ -635,30 +797,30 @@ class PythonParser:
         """
         parsed_arguments = {"arguments": [], "keyword_arguments": []}
 
-        arguments = re.search(r"^\s*def\s+\w+\((.*)\)", line)
+        arguments = _ARGUMENTS_RE.search(line)
 
         log.debug("found arguments by re -- %r", arguments)
 
-        # Parse type hints
-        hints = dict(
-            re.findall(r"(\w+)\s*:\s*([\w\.]+\[[^:]*\]|[\w\.]+)\s*", arguments.group(1))  # type: ignore
-        )
+        hints: Dict[str, str] = {}
 
-        log.debug("hints: %s", hints)
+        def strip_hint(match):
+            hints[match.group(1)] = match.group(2)
+            return match.group(1)
 
-        # Remove type hints
-        arguments = re.sub(r":\s*([\w\.]+\[[^:]*\]|[\w\.]+)\s*", "", arguments.group(1))  # type: ignore
+        # Parse and remove type hints in a single pass
+        arguments = _TYPEHINT_RE.sub(strip_hint, arguments.group(1))  # type: ignore
+
+        log.debug("hints: %s", hints)
 
         if not arguments:
             return None
 
-        excluded_parameters = ["self", "cls"]
         arguments = split_by_commas(arguments)
 
         log.debug("arguments: %s", arguments)
 
         for index, argument in enumerate(arguments):
-            if index == 0 and argument in excluded_parameters:
+            if index == 0 and argument in _EXCLUDED_PARAMETERS:
                 continue
 
             argument_type = "keyword_arguments" if "=" in argument else "arguments"
@@ -672,29 +834,23 @@ class PythonParser:
 
         return parsed_arguments
 
-    def parse_returns(self, contents: str):
+    def parse_returns(self, returns: List[Tuple[str, str]], contents: str):
         """Find the first instances of returning in the definition.
 
-        Parses through the whole definition for occurrances of the keyword `return`,
-        or `yield` and returns the first. Tries guess the type of the value.
+        Takes the occurrances of the keyword `return`, or `yield` found in the
+        definition and returns the first. Tries guess the type of the value.
 
         Arguments:
+            returns {list} -- (keyword, value) pairs found by `scan_function`
             contents {str} -- contents of the definition
 
         Returns:
             {tuple} -- type of return and a dict for the return value type
         """
-        regex = re.compile(r"^\s*(return|yield) (\S+)", re.MULTILINE)
-        match = re.findall(regex, contents)
-
-        if len(match) == 0:
+        if len(returns) == 0:
             return None
 
-        hint = re.search(
-            r"^\s*def\s+\w+\(.*\)\s*->\s*([\w\.]+\[[^:]*\]|[\w\.]+)\s*:",
-            contents,
-            flags=re.DOTALL,
-        )
+        hint = _RETURN_HINT_RE.search(contents)
         if hint:
             hint = hint.group(1)
             log.debug(
@@ -702,34 +858,31 @@ class PythonParser:
                 hint,
             )
 
-        match = match[0]
+        match = returns[0]
         return_type = match[0] + "s"
         return_value_type = hint or guess_type_from_value(match[1])
 
         return (return_type, {"type": return_value_type})
 
-    def parse_raises(self, contents):
+    def parse_raises(self, exceptions: List[str]):
         """Find instances of raised exceptions in the definition.
 
-        Parses through the whole definition for occurrances of the keyword `raise`,
+        Takes the occurrances of the keyword `raise` found in the definition,
         and appends the following value to the list of exceptions to be returned.
 
         Arguments:
-            contents {str} -- contents of the definition
+            exceptions {list} -- exception types found by `scan_function`
 
         Returns:
             {list} -- list of exception types
         """
-        regex = re.compile(r"^\s*(raise) (\w+)", re.MULTILINE)
-        match = re.findall(regex, contents)
-
-        if len(match) == 0:
+        if len(exceptions) == 0:
             return None
 
         raises = []
-        for exception in match:
-            if exception[1] not in raises:
-                raises.append(exception[1])
+        for exception in exceptions:
+            if exception not in raises:
+                raises.append(exception)
 
         return raises
 
@@ -747,13 +900,11 @@ class PythonParser:
         Returns:
             {Dictionary} Parsed valued group by type
         """
-        if not re.match(r"^\s*(def )", line):
-            log.debug("not function type")
-            return None
-
         parsed_function = []
 
-        decorators = self.parse_decorators(line, contents)
+        decorators, returns, raises = self.scan_function(contents)
+
+        decorators = self.parse_decorators(decorators)
         if len(decorators) > 0:
             parsed_function.append(("decorators", decorators))
 
@@ -761,11 +912,11 @@ class PythonParser:
         if arguments is not None:
             parsed_function.append(("arguments", arguments))
 
-        returns = self.parse_returns(contents)
+        returns = self.parse_returns(returns, contents)
         if returns is not None:
             parsed_function.append(returns)
 
-        raises = self.parse_raises(contents)
+        raises = self.parse_raises(raises)
         if raises is not None:
             parsed_function.append(("raises", raises))
 
@@ -773,7 +924,7 @@ class PythonParser:
 
         return parsed_function
 
-    def is_docstring_closed(self, view, position):
+    def is_docstring_closed(self, view, position, text, tab_size):
         """Check if the current docstring is supposed to be closed.
 
         Keep reading lines until we reach the end of the file, class, or function
@@ -783,6 +934,8 @@ class PythonParser:
         Arguments:
             view     {sublime.View} -- Current Sublime Text View
             position {Integer}      -- Position in the view where the docstring is
+            text     {String}       -- Contents of the view
+            tab_size {Integer}      -- Width of one indentation level
 
         Returns:
             {Bool} True if the docstring is confirmed closed
@@ -798,24 +951,29 @@ class PythonParser:
                         "could not find closing string.  Match was: {}".format(match)
                     )
 
-        indentation_level = view.indentation_level(position)
-
         # Check the current line first, and ignore if docstring is closed on this line
-        line = view.substr(view.line(position))
-        match = re.search(r'^\s*(""".*"""|\'\'\'.*\'\'\')\s*$', line)
+        begin, end = line_bounds(text, position)
+        line = text[begin:end]
+
+        # The opening quotes are always on this line, it takes a second set of them
+        # for the docstring to be closed here as well
+        if line.count('"""') > 1 or line.count("'''") > 1:
+            match = _INLINE_DOCSTRING_RE.search(line)
+
+            if match is not None:
+                set_closing_string(match)
+                return False
 
-        if match is not None:
-            set_closing_string(match)
-            return False
+        indentation_level = get_indentation_level(line, tab_size)
 
-        for current_line in read_next_line(view, position):
+        for current_line_string in read_next_line(text, position):
             # Not an empty line
-            current_line_string = view.substr(current_line).rstrip()
+            current_line_string = current_line_string.rstrip()
             if not len(current_line_string):
                 continue
 
             # Not on a more indented line
-            current_indentation = view.indentation_level(current_line.end())
+            current_indentation = get_indentation_level(current_line_string, tab_size)
             if current_indentation > indentation_level:
                 continue
 
@@ -824,12 +982,12 @@ class PythonParser:
                 break
 
             # Line only contains whitespace and """
-            match = re.search(r'^\s*("""|\'\'\')', current_line_string)
+            match = _DOCSTRING_OPEN_RE.search(current_line_string)
             if match is not None:
                 set_closing_string(match)
                 return True
 
-        set_closing_string(re.search(r'^\s*("""|\'\'\')', line))
+        set_closing_string(_DOCSTRING_OPEN_RE.search(line))
         return False
 
 
@@ -843,7 +1001,7 @@ def get_parser(view: sublime.View) -> Optional[PythonParser]:
         {PythonParser} or None if the current file type isn't a python file
     """
     scope = view.scope_name(view.sel()[0].end())
-    res = re.search(r"\bsource\.([a-z+\-]+)", scope)
+    res = _SOURCE_LANG_RE.search(scope)
     source_lang = res.group(1) if res else "js"
     view_settings = view.settings()
 